@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+from constants import LOCAL_TIMEZONE
+
+
+def ToUnixTimestamp(value):
+    # Integers are already unix timestamps (seconds)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+
+    # Floats (e.g. time.time()) are unix seconds too; rounding up keeps the
+    # half-open [start, end) bounds exact for whole-second candle timestamps
+    if isinstance(value, (float, np.floating)):
+        return int(np.ceil(value))
+
+    # Strings, datetimes and pandas Timestamps without a timezone are read as
+    # local time, matching the 'datetime' column written by get_datetimes.
+    # A time repeated when daylight saving ends means its first (daylight
+    # time) occurrence; a time skipped when it starts moves to the next valid
+    # instant, so bounds taken from the 'datetime' column never raise
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize(LOCAL_TIMEZONE, ambiguous=True, nonexistent="shift_forward")
+    return int(ts.timestamp())
+
+
+def SortedTimestamps(df):
+    # Zero-copy int64 view of the 'timestamp' column
+    return df["timestamp"].to_numpy(dtype=np.int64, copy=False)
+
+
+def RequireSorted(df):
+    # Order-dependent calculations (e.g. first/last aggregations) are only
+    # correct on frames in chronological order, e.g. CandleIndex.df
+    if not df["timestamp"].is_monotonic_increasing:
+        raise ValueError("Candles must be sorted by 'timestamp'; build a CandleIndex first.")
+
+
+def SliceByTimestamp(df, start=None, end=None):
+    # Binary search the half-open range [start, end) on a frame that is
+    # already sorted by 'timestamp'; returns a positional slice (view)
+    timestamps = SortedTimestamps(df)
+    lo = 0 if start is None else np.searchsorted(timestamps, ToUnixTimestamp(start), side="left")
+    hi = len(timestamps) if end is None else np.searchsorted(timestamps, ToUnixTimestamp(end), side="left")
+    return df.iloc[lo:max(lo, hi)]
+
+
+def ApplyTimeRange(df, timeRange):
+    # Reports accept either a plain frame or a CandleIndex
+    frame = df.df if isinstance(df, CandleIndex) else df
+
+    # No range means the report runs over the full history
+    if timeRange is None:
+        return frame
+
+    # Only a CandleIndex guarantees timestamp order, so ranges are never
+    # binary searched on a frame whose order is unknown (and never rescanned)
+    if not isinstance(df, CandleIndex):
+        raise TypeError("timeRange needs a CandleIndex; pass CandleIndex(df) instead of the frame.")
+
+    # Reports add derived columns, so work on a copy of just the slice
+    start, end = timeRange
+    return df.between(start, end).copy()
+
+
+class CandleIndex:
+    def __init__(self, df):
+        timestamps = SortedTimestamps(df)
+        steps = np.diff(timestamps)
+
+        # Only pay for a sort when the data isn't already ordered; candle
+        # files from the fetcher are newest first, so a reverse is enough
+        if (steps >= 0).all():
+            ordered = df
+        elif (steps <= 0).all():
+            ordered = df.iloc[::-1]
+        else:
+            ordered = df.iloc[np.argsort(timestamps, kind="stable")]
+
+        # Store timestamps as int64 so binary search compares integers
+        self.df = ordered.reset_index(drop=True)
+        self.df["timestamp"] = self.df["timestamp"].astype(np.int64)
+        self.timestamps = SortedTimestamps(self.df)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    # The range queries below return views that share memory with self.df.
+    # Treat them as read-only; to run a report over a range, pass timeRange
+    # instead so the report works on its own copy of the slice.
+    def between(self, start, end):
+        # Candles with start <= timestamp < end
+        return SliceByTimestamp(self.df, start, end)
+
+    def since(self, ts):
+        # Candles from ts (inclusive) to the end of the data
+        return SliceByTimestamp(self.df, start=ts)
+
+    def last_n_weeks_start(self, n):
+        # Find local midnight on the Monday of the most recent week, then step
+        # back so the range holds n calendar weeks (the last may be partial).
+        # Calendar offsets keep local midnight across daylight saving changes.
+        last = pd.Timestamp(int(self.timestamps[-1]), unit="s", tz="UTC").tz_convert(LOCAL_TIMEZONE)
+        return last.normalize() - pd.DateOffset(days=last.weekday(), weeks=n - 1)
+
+    def last_n_weeks(self, n):
+        if n <= 0 or len(self) == 0:
+            return self.df.iloc[0:0]
+        return self.since(self.last_n_weeks_start(n))
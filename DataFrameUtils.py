@@ -1,8 +1,12 @@
 import pandas as pd
 from constants import DAYS_OF_THE_WEEK
+from CandleIndex import ApplyTimeRange
 
 
-def GetFrequentHighLowByHour(df, filterFirst):
+def GetFrequentHighLowByHour(df, filterFirst, timeRange=None):
+    # Restrict to the requested [start, end) range, if any
+    df = ApplyTimeRange(df, timeRange)
+
     # Convert 'datetime' column to datetime type
     df["datetime"] = pd.to_datetime(df["datetime"])
     # Extract relevant features
@@ -53,7 +57,10 @@ def GetFrequentHighLowByHour(df, filterFirst):
     return probability_df.groupby("day").head(filterFirst)
 
 
-def GetAverageAndMedianWeeklyRange(df):
+def GetAverageAndMedianWeeklyRange(df, timeRange=None):
+    # Restrict to the requested [start, end) range, if any
+    df = ApplyTimeRange(df, timeRange)
+
     # Extract the week and year to group by week
     df["week"] = df["datetime"].dt.to_period("W")
     # Convert 'datetime' column to datetime type
@@ -83,15 +90,18 @@ def GetAverageAndMedianWeeklyRange(df):
     return average_range, median_range
 
 
-def PrintAverageAndMedianWeeklyRange(df):
-    average, median = GetAverageAndMedianWeeklyRange(df)
+def PrintAverageAndMedianWeeklyRange(df, timeRange=None):
+    average, median = GetAverageAndMedianWeeklyRange(df, timeRange=timeRange)
 
     # Print results
     print(f"\nAverage weekly price difference: {average:.2f}")
     print(f"\nMedian weekly price difference: {median:.2f}")
 
 
-def GetHighLowProbabilityByHour(df, topn=12):
+def GetHighLowProbabilityByHour(df, topn=12, timeRange=None):
+    # Restrict to the requested [start, end) range, if any
+    df = ApplyTimeRange(df, timeRange)
+
     # Convert 'datetime' column to datetime type if not already
     df["datetime"] = pd.to_datetime(df["datetime"])
     
@@ -164,7 +174,10 @@ def GetHighLowProbabilityByHour(df, topn=12):
     return newFrame
 
 
-def GetHighLowProbabilityByDay(df):
+def GetHighLowProbabilityByDay(df, timeRange=None):
+    # Restrict to the requested [start, end) range, if any
+    df = ApplyTimeRange(df, timeRange)
+
     # Extract the week and year to group by week
     df["week"] = df["datetime"].dt.to_period("W")
     # Convert 'datetime' column to datetime type
@@ -212,7 +225,10 @@ def GetHighLowProbabilityByDay(df):
     return pd.DataFrame(day_probability).T
 
 
-def GetTopHighLowProbabilityByHourAndDay(df, top_n=8):
+def GetTopHighLowProbabilityByHourAndDay(df, top_n=8, timeRange=None):
+    # Restrict to the requested [start, end) range, if any
+    df = ApplyTimeRange(df, timeRange)
+
     # Convert 'datetime' column to datetime type
     df["datetime"] = pd.to_datetime(df["datetime"])
 
@@ -295,7 +311,10 @@ def GetTopHighLowProbabilityByHourAndDay(df, top_n=8):
 
     return result_df
 
-def CountWeeklyHighLowOccurrences(df):
+def CountWeeklyHighLowOccurrences(df, timeRange=None):
+    # Restrict to the requested [start, end) range, if any
+    df = ApplyTimeRange(df, timeRange)
+
     # Convert 'datetime' column to datetime type
     df["datetime"] = pd.to_datetime(df["datetime"])
 
@@ -324,7 +343,10 @@ def CountWeeklyHighLowOccurrences(df):
 
     return day_counts
 
-def GetHighestAvgVolumeHours(df, top_n=12):
+def GetHighestAvgVolumeHours(df, top_n=12, timeRange=None):
+    # Restrict to the requested [start, end) range, if any
+    df = ApplyTimeRange(df, timeRange)
+
     # Convert 'datetime' column to datetime type if not already
     if not pd.api.types.is_datetime64_any_dtype(df["datetime"]):
         df["datetime"] = pd.to_datetime(df["datetime"])
@@ -343,41 +365,41 @@ def GetHighestAvgVolumeHours(df, top_n=12):
 
     return highest_avg_volume_hours
 
-def PrintGetHighestVolumeHours(df):
+def PrintGetHighestVolumeHours(df, timeRange=None):
     print(
         "\nHighest cumulative volume per hour of the day:\n\n",
-        GetHighestAvgVolumeHours(df).to_string(index=False),
+        GetHighestAvgVolumeHours(df, timeRange=timeRange).to_string(index=False),
     )
 
-def PrintWeeklyHighLowOccurrences(df):
+def PrintWeeklyHighLowOccurrences(df, timeRange=None):
         print(
         "\nNumber of high or low occurring on each day:\n\n",
-        CountWeeklyHighLowOccurrences(df),
+        CountWeeklyHighLowOccurrences(df, timeRange=timeRange),
     )
 
-def PrintTopHighLowProbabilityByHourAndDay(df):
+def PrintTopHighLowProbabilityByHourAndDay(df, timeRange=None):
     print(
         "\nChances of high or low occurring on a specific day and hour:\n\n",
-        GetTopHighLowProbabilityByHourAndDay(df),
+        GetTopHighLowProbabilityByHourAndDay(df, timeRange=timeRange),
     )
 
 
-def PrintHighLowProbabilityByDay(df):
+def PrintHighLowProbabilityByDay(df, timeRange=None):
     print(
         "\nChances of high or low occurring on a specific day:\n\n",
-        GetHighLowProbabilityByDay(df),
+        GetHighLowProbabilityByDay(df, timeRange=timeRange),
     )
 
 
-def PrintHighLowProbabilityByHour(df):
+def PrintHighLowProbabilityByHour(df, timeRange=None):
     print(
         "\nChances of high or low occurring within a specific hour of the day:\n\n",
-        GetHighLowProbabilityByHour(df).to_string(index=False),
+        GetHighLowProbabilityByHour(df, timeRange=timeRange).to_string(index=False),
     )
 
 
-def PrintFrequentHighLowByHour(df):
+def PrintFrequentHighLowByHour(df, filterFirst=5, timeRange=None):
     print(
         "\nFrequency of daily high or low occurences by hour:\n\n",
-        GetFrequentHighLowByHour(df),
+        GetFrequentHighLowByHour(df, filterFirst, timeRange=timeRange),
     )
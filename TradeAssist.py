@@ -10,6 +10,12 @@ from DataFrameUtils import (
     PrintGetHighestVolumeHours
 )
 from utils import RenameColumns
+from CandleIndex import CandleIndex
+from WeeklyFeatures import (
+    BuildWeeklyFeatures,
+    PrintConditionalProbability,
+    PrintOutcomeProbability,
+)
 
 
 def Main():
@@ -21,8 +27,9 @@ def Main():
         
         RenameColumns(df)
 
-        # Sort data in chronological order
-        df.sort_values(by="datetime", ascending=True, inplace=True)
+        # Index candles in chronological order by unix timestamp
+        candles = CandleIndex(df)
+        df = candles.df
 
         # Convert 'datetime' column to datetime type
         df["datetime"] = pd.to_datetime(df["datetime"])
@@ -37,6 +44,18 @@ def Main():
         # PrintWeeklyHighLowOccurrences(df)
         PrintHighLowProbabilityByHour(df)
         # PrintGetHighestVolumeHours(df)
+
+        # Reports can be limited to a date range, e.g. the last 26 weeks
+        # PrintHighLowProbabilityByDay(candles, timeRange=(candles.last_n_weeks_start(26), None))
+        # PrintHighLowProbabilityByDay(candles, timeRange=("2025-01-01", "2025-02-01"))
+
+        # Build the per-week feature table once, then ask conditional questions
+        # features = BuildWeeklyFeatures(candles)
+        # PrintConditionalProbability(
+        #     features, 'high_day == "Thu"', given="high_through_Tue == high_through_Mon"
+        # )
+        # median = features["range"].median()
+        # PrintOutcomeProbability(features, ["high_day", "high_hour"], given=f"range > {median}")
         print("\n")
 
 
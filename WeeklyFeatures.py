@@ -0,0 +1,118 @@
+import pandas as pd
+from constants import DAYS_OF_THE_WEEK
+from CandleIndex import ApplyTimeRange, CandleIndex, RequireSorted
+
+
+def BuildWeeklyFeatures(df, timeRange=None):
+    # Restrict to the requested [start, end) range, if any
+    frame = ApplyTimeRange(df, timeRange)
+
+    # Weekly open/close depend on candle order; a CandleIndex already
+    # guarantees it, so only a plain frame is checked (once) here
+    if not isinstance(df, CandleIndex):
+        RequireSorted(frame)
+    df = frame
+
+    # Work on the few columns we need, with positional labels so the
+    # idxmax/idxmin lookups below stay unique whatever the input index was
+    candles = df[["timestamp", "datetime", "day", "open", "high", "low", "close", "volume"]].reset_index(drop=True)
+    candles["datetime"] = pd.to_datetime(candles["datetime"])
+    candles["week"] = candles["datetime"].dt.to_period("W")
+    candles["hour"] = candles["datetime"].dt.hour
+
+    # Weekly open/close/extremes/volume plus where the extremes happened
+    weekly = candles.groupby("week").agg(
+        open=("open", "first"),
+        close=("close", "last"),
+        high=("high", "max"),
+        low=("low", "min"),
+        volume=("volume", "sum"),
+        candles=("open", "size"),
+        high_row=("high", "idxmax"),
+        low_row=("low", "idxmin"),
+    )
+    weekly["range"] = weekly["high"] - weekly["low"]
+    weekly["high_day"] = candles.loc[weekly["high_row"], "day"].to_numpy()
+    weekly["high_hour"] = candles.loc[weekly["high_row"], "hour"].to_numpy()
+    weekly["low_day"] = candles.loc[weekly["low_row"], "day"].to_numpy()
+    weekly["low_hour"] = candles.loc[weekly["low_row"], "hour"].to_numpy()
+    weekly.drop(columns=["high_row", "low_row"], inplace=True)
+
+    # Per-day extremes laid out Mon..Sun, then turned into week-to-date
+    # running extremes; days without candles carry the previous day's value
+    daily = candles.groupby(["week", "day"]).agg(high=("high", "max"), low=("low", "min"))
+    daily_highs = daily["high"].unstack("day").reindex(columns=DAYS_OF_THE_WEEK)
+    daily_lows = daily["low"].unstack("day").reindex(columns=DAYS_OF_THE_WEEK)
+    running_highs = daily_highs.cummax(axis=1).ffill(axis=1)
+    running_lows = daily_lows.cummin(axis=1).ffill(axis=1)
+    for day in DAYS_OF_THE_WEEK:
+        weekly[f"high_through_{day}"] = running_highs[day]
+        weekly[f"low_through_{day}"] = running_lows[day]
+
+    return weekly.reset_index()
+
+
+def SelectWeeks(features, condition):
+    # No condition selects every week
+    if condition is None:
+        return pd.Series(True, index=features.index)
+
+    # Conditions can be a boolean expression over the feature columns (same
+    # syntax as DataFrame.query), a callable taking the feature table, or a
+    # boolean Series aligned with it
+    if isinstance(condition, str):
+        mask = features.eval(condition)
+        if not isinstance(mask, pd.Series) or not pd.api.types.is_bool_dtype(mask):
+            raise ValueError(f"Condition '{condition}' must evaluate to True/False per week.")
+        return mask
+    if callable(condition):
+        return pd.Series(condition(features), index=features.index).astype(bool)
+    return condition.reindex(features.index, fill_value=False).astype(bool)
+
+
+def ConditionalProbability(features, event, given=None, by=None):
+    # Keep only the weeks that satisfy the condition
+    weeks = features[SelectWeeks(features, given)]
+    hits = SelectWeeks(weeks, event)
+
+    # Single probability (in %) of the event across the selected weeks
+    if by is None:
+        return hits.mean() * 100 if len(weeks) else float("nan")
+
+    # Otherwise break the probability down per group
+    result = hits.groupby([weeks[column] for column in _AsList(by)]).agg(weeks="size", matches="sum")
+    result["probability"] = result["matches"] / result["weeks"] * 100
+    return result.reset_index()
+
+
+def OutcomeProbability(features, outcome, given=None):
+    # Keep only the weeks that satisfy the condition
+    weeks = features[SelectWeeks(features, given)]
+
+    # How often each outcome value (or combination) occurred, in %; weeks
+    # with a missing value (NaN) are kept as their own row so totals add to 100
+    counts = weeks.value_counts(subset=_AsList(outcome), dropna=False).rename("weeks")
+    result = counts.reset_index()
+    result["probability"] = result["weeks"] / len(weeks) * 100
+    return result
+
+
+def PrintConditionalProbability(features, event, given=None, by=None):
+    result = ConditionalProbability(features, event, given=given, by=by)
+    condition = f" given {given}" if isinstance(given, str) else ""
+    if by is None:
+        print(f"\nChance of {event}{condition}: {result:.2f}%")
+    else:
+        print(f"\nChance of {event}{condition}:\n\n", result.to_string(index=False))
+
+
+def PrintOutcomeProbability(features, outcome, given=None):
+    condition = f" given {given}" if isinstance(given, str) else ""
+    print(
+        f"\nChances of {', '.join(_AsList(outcome))}{condition}:\n\n",
+        OutcomeProbability(features, outcome, given=given).to_string(index=False),
+    )
+
+
+def _AsList(columns):
+    return [columns] if isinstance(columns, str) else list(columns)
@@ -19,4 +19,6 @@ TIME_FRAMES = (
     "1w",
 )
 
-DAYS_OF_THE_WEEK = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
\ No newline at end of file
+DAYS_OF_THE_WEEK = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+LOCAL_TIMEZONE = "Australia/Adelaide"
@@ -4,6 +4,8 @@ from zoneinfo import ZoneInfo
 import json
 import sys
 
+from constants import LOCAL_TIMEZONE
+
 
 def save_to_json(data, filename):
     try:
@@ -60,7 +62,7 @@ def get_datetimes(candleData):
         utc_time = datetime.fromtimestamp(candle["t"], tz=timezone.utc)
 
         # Convert to Adelaide time
-        adelaide_time = utc_time.astimezone(ZoneInfo("Australia/Adelaide"))
+        adelaide_time = utc_time.astimezone(ZoneInfo(LOCAL_TIMEZONE))
         candle["day"] = adelaide_time.strftime("%a")
         candle["datetime"] = adelaide_time.strftime("%Y-%m-%d %H:%M:%S")
 